@@ -39,6 +39,7 @@ from .algorithms import (
     gradient_descent,
     hill_climb,
     mimic,
+    mimic_binary,
     random_hill_climb,
     simulated_annealing,
 )
@@ -6,7 +6,7 @@
 from .ga import genetic_alg
 from .gd import gradient_descent
 from .hc import hill_climb
-from .mimic import mimic
+from .mimic import mimic, mimic_binary
 from .rhc import random_hill_climb
 from .sa import simulated_annealing
 
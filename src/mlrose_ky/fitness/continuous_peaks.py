@@ -5,6 +5,26 @@
 
 import numpy as np
 
+from mlrose_ky.fitness._continuous_peaks_numba import _cp_eval, _cp_eval_batch
+
+
+def _as_int8_states(states: np.ndarray) -> np.ndarray:
+    """
+    Return `states` as a C-contiguous int8 array for the Numba kernels.
+
+    int8 and bool states are passed through (or cast exactly). Any other dtype is mapped rather than cast, so that
+    values which would wrap or truncate in int8 (such as 256 or 0.4) cannot turn into 0 or 1: elements equal to 0 or 1
+    keep their value and every other element becomes 2, which breaks runs exactly as the original value does.
+    """
+    if states.dtype == np.int8 or states.dtype == np.bool_:
+        return np.ascontiguousarray(states, dtype=np.int8)
+
+    mapped = np.full(states.shape, 2, dtype=np.int8)
+    mapped[states == 0] = 0
+    mapped[states == 1] = 1
+
+    return mapped
+
 
 class ContinuousPeaks:
     """
@@ -39,6 +59,7 @@ class ContinuousPeaks:
 
     def __init__(self, t_pct: float = 0.1):
         self.prob_type: str = "discrete"
+        self.is_binary: bool = True
         self.t_pct: float = t_pct
 
         if not (0 <= self.t_pct <= 1):
@@ -61,15 +82,32 @@ class ContinuousPeaks:
         if not isinstance(state, np.ndarray):
             raise TypeError(f"Expected state to be np.ndarray, got {type(state).__name__} instead.")
 
-        num_elements = len(state)
-        threshold = int(np.ceil(self.t_pct * num_elements))
+        threshold = int(np.ceil(self.t_pct * len(state)))
+
+        return _cp_eval(_as_int8_states(state), threshold)
 
-        max_zeros = self.max_run(0, state)
-        max_ones = self.max_run(1, state)
+    def evaluate_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the fitness of every state vector in a population at once.
+
+        Parameters
+        ----------
+        states : np.ndarray
+            2D array of shape (pop_size, n) whose rows are state vectors.
+
+        Returns
+        -------
+        np.ndarray
+            1D array of fitness values, one per row of `states`.
+        """
+        if not isinstance(states, np.ndarray):
+            raise TypeError(f"Expected states to be np.ndarray, got {type(states).__name__} instead.")
+        if states.ndim != 2:
+            raise ValueError(f"Expected states to be a 2D array, got {states.ndim} dimensions instead.")
 
-        reward = num_elements if max_zeros > threshold and max_ones > threshold else 0
+        threshold = int(np.ceil(self.t_pct * states.shape[1]))
 
-        return float(max(max_zeros, max_ones) + reward)
+        return _cp_eval_batch(_as_int8_states(states), threshold)
 
     def get_prob_type(self) -> str:
         """
@@ -65,6 +65,7 @@ class SixPeaks(_DiscretePeaksBase):
             Threshold parameter (T) for Six Peaks fitness function.
         """
         self.prob_type: str = "discrete"
+        self.is_binary: bool = True
         self.t_pct: float = t_pct
 
         if not (0 <= self.t_pct <= 1):
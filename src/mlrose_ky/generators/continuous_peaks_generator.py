@@ -3,11 +3,21 @@
 # Authors: Genevieve Hayes (modified by Andrew Rollings, Kyle Nakamura)
 # License: BSD 3-clause
 
+import numbers
+import operator
+from functools import lru_cache
+
 import numpy as np
 
 from mlrose_ky import DiscreteOpt, ContinuousPeaks
 
 
+@lru_cache(maxsize=32)
+def _continuous_peaks_fitness(t_pct: float) -> ContinuousPeaks:
+    """Return a Continuous Peaks fitness function for `t_pct`, shared between all problems generated with that value."""
+    return ContinuousPeaks(t_pct=t_pct)
+
+
 class ContinuousPeaksGenerator:
     """A class to generate Continuous Peaks optimization problems."""
 
@@ -23,26 +33,36 @@ class ContinuousPeaksGenerator:
         size : int, optional, default=20
             The size of the optimization problem.
         t_pct : float, optional, default=0.1
-            The threshold percentage for the Continuous Peaks fitness function.
+            The threshold percentage for the Continuous Peaks fitness function. Any real number, including integers and
+            NumPy scalars, is accepted.
 
         Returns
         -------
         problem : Any
-            An instance of the DiscreteOpt class representing the optimization problem.
+            An instance of the DiscreteOpt class representing the optimization problem. Each call returns a new problem
+            with its own state, but the fitness function is shared between all problems generated with the same `t_pct`.
 
         Raises
         ------
         ValueError
-            If the `size` is not a positive integer or if `t_pct` is not between 0 and 1.
+            If the `size` is not a positive integer or if `t_pct` is not a real number between 0 and 1.
         """
-        if not isinstance(size, int) or size <= 0:
+        try:
+            length = operator.index(size)
+        except TypeError:
+            length = 0
+        if length <= 0:
             raise ValueError(f"Size must be a positive integer. Got {size}")
-        if not isinstance(t_pct, float):
+        if not isinstance(t_pct, numbers.Real):
             raise ValueError(f"Threshold percentage must be a float. Got {type(t_pct).__name__}")
-        if not (0 <= t_pct <= 1):
+
+        t_pct = float(t_pct)
+        if not 0.0 <= t_pct <= 1.0:
             raise ValueError(f"Threshold percentage must be between 0 and 1. Got {t_pct}")
 
+        # The problem draws from the global random state, which the algorithms reseed from their `random_state`
         np.random.seed(seed)
 
-        fitness = ContinuousPeaks(t_pct=t_pct)
-        return DiscreteOpt(length=size, fitness_fn=fitness)
+        fitness = _continuous_peaks_fitness(t_pct)
+
+        return DiscreteOpt(length=length, fitness_fn=fitness, dtype=np.int8)
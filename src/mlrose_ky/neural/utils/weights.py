@@ -22,12 +22,10 @@ def flatten_weights(weights: List[np.ndarray]) -> np.ndarray:
     np.ndarray
         1D array of flattened weights.
     """
-    flat_weights = []
+    if len(weights) == 0:
+        return np.array([])
 
-    for weight in weights:
-        flat_weights += list(weight.flatten())
-
-    return np.array(flat_weights)
+    return np.concatenate([np.ravel(weight) for weight in weights])
 
 
 def unflatten_weights(flat_weights: np.ndarray, node_list: List[int]) -> List[np.ndarray]:
@@ -48,20 +46,17 @@ def unflatten_weights(flat_weights: np.ndarray, node_list: List[int]) -> List[np
     list of np.ndarray
         List of 2D arrays created from flat_weights.
     """
-    nodes = sum(node_list[i] * node_list[i + 1] for i in range(len(node_list) - 1))
+    shapes = list(zip(node_list[:-1], node_list[1:]))
+    offsets = np.cumsum([rows * cols for rows, cols in shapes])
+    nodes = int(offsets[-1]) if len(offsets) else 0
 
     if len(flat_weights) != nodes:
         raise ValueError(f"flat_weights must have length {nodes}, but got {len(flat_weights)}.")
 
-    weights = []
-    start = 0
-
-    for i in range(len(node_list) - 1):
-        end = start + node_list[i] * node_list[i + 1]
-        weights.append(np.reshape(flat_weights[start:end], [node_list[i], node_list[i + 1]]))
-        start = end
+    # Each chunk is reshaped as a view of flat_weights, so no weights are copied.
+    chunks = np.split(np.asarray(flat_weights), offsets[:-1])
 
-    return weights
+    return [chunk.reshape(shape) for chunk, shape in zip(chunks, shapes)]
 
 
 def gradient_descent_original(
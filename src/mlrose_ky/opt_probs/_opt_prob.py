@@ -227,8 +227,21 @@ class _OptProb:
         self.evaluate_population_fitness()
 
     def evaluate_population_fitness(self) -> None:
-        """Evaluate the fitness of the current population."""
-        self.pop_fitness = np.array([self.eval_fitness(indiv) for indiv in self.population])
+        """Evaluate the fitness of the current population.
+
+        If the fitness function provides an `evaluate_batch` method, the whole population is evaluated in a single call.
+        """
+        evaluate_batch = getattr(self.fitness_fn, "evaluate_batch", None)
+
+        if evaluate_batch is None or self.population.ndim != 2:
+            self.pop_fitness = np.array([self.eval_fitness(indiv) for indiv in self.population])
+            return
+
+        if self.population.shape[1] != self.length:
+            raise ValueError(f"State length {self.population.shape[1]} must match problem length {self.length}.")
+
+        self.pop_fitness = self.maximize * np.asarray(evaluate_batch(self.population))
+        self.fitness_evaluations += len(self.population)
 
     def set_state(self, new_state: np.ndarray) -> None:
         """Set a new state vector and evaluate its fitness.
@@ -40,6 +40,17 @@ class DiscreteOpt(_OptProb):
     mutator : SwapMutator, default=None
         Mutation operation used for reproduction. If None, defaults to `SwapMutator`.
 
+    rng : np.random.Generator, default=None
+        Random number generator used to draw states and samples. If None, NumPy's global random state is used.
+        The `random_state` argument of the optimization algorithms only seeds the global random state and does not
+        reseed `rng`, so repeated algorithm calls on the same problem continue the generator's stream rather than
+        reproducing each other. Only the runners reseed it, giving each grid point its own stream derived from the
+        runner's seed. Pass a freshly seeded generator (or a new problem) to reproduce a direct algorithm call.
+
+    dtype : np.dtype, default=None
+        Integer data type used to store states and sampled populations, e.g. `np.int8` for bit strings.
+        If None, random states are int64 and sampled populations are float64.
+
     Attributes
     ----------
     keep_sample : np.ndarray
@@ -54,6 +65,10 @@ class DiscreteOpt(_OptProb):
         Problem type; always 'discrete' for this class.
     noise : float
         Noise factor for probability density estimation.
+    rng : np.random.Generator | None
+        Random number generator used to draw states and samples, or None to use NumPy's global random state.
+    dtype : np.dtype | None
+        Data type used to store states and sampled populations, or None for the default types.
     _crossover : UniformCrossOver
         Crossover operation for reproduction.
     _mutator : SwapMutator
@@ -72,6 +87,8 @@ class DiscreteOpt(_OptProb):
         max_val: int = 2,
         crossover: UniformCrossOver | TSPCrossOver = None,
         mutator: "SwapMutator" = None,
+        rng: np.random.Generator = None,
+        dtype: np.dtype = None,
     ):
         self._get_mutual_info_impl = self._get_mutual_info_slow
 
@@ -84,6 +101,10 @@ class DiscreteOpt(_OptProb):
             )
         if not isinstance(max_val, int) or max_val < 0:
             raise ValueError(f"max_val must be a positive integer. Got {max_val}")
+        if dtype is not None:
+            dtype = np.dtype(dtype)
+            if dtype.kind not in "iu" or np.iinfo(dtype).max < max_val - 1:
+                raise ValueError(f"dtype must be an integer type that can hold values up to {max_val - 1}. Got {dtype}")
 
         self.max_val: int = max_val
         self.prob_type: str = "discrete"
@@ -92,6 +113,11 @@ class DiscreteOpt(_OptProb):
         self.parent_nodes: np.ndarray = np.array([])
         self.sample_order: list[int] = []
         self.noise: float = 0
+        self.rng: np.random.Generator | None = rng
+        self.dtype: np.dtype | None = dtype
+
+        if self.dtype is not None:
+            self.state = self.state.astype(self.dtype)
 
         self._crossover: UniformCrossOver | TSPCrossOver = UniformCrossOver(self) if crossover is None else crossover
         self._mutator: SwapMutator = SwapMutator(self) if mutator is None else mutator
@@ -99,6 +125,18 @@ class DiscreteOpt(_OptProb):
         self._mut_mask: np.ndarray | None = None
         self._mut_inf: np.ndarray | None = None
 
+    @property
+    def _random(self) -> Any:
+        """Return the source of randomness: `rng` if set, otherwise the `np.random` module."""
+        return np.random if self.rng is None else self.rng
+
+    def _random_integers(self, low: int, high: int, size: int = None, dtype: np.dtype = None) -> int | np.ndarray:
+        """Return random integers from `low` (inclusive) to `high` (exclusive), of type `dtype` if given."""
+        if self.rng is None:
+            return np.random.randint(low, high, size, dtype=int if dtype is None else dtype)
+
+        return self.rng.integers(low, high, size, dtype=np.int64 if dtype is None else dtype)
+
     def eval_node_probs(self) -> None:
         """Update probability density estimates."""
         mutual_info = self._get_mutual_info_impl()
@@ -205,6 +243,36 @@ class DiscreteOpt(_OptProb):
 
         return mutual_info
 
+    def _get_mutual_info_binary(self) -> np.ndarray:
+        """
+        Compute the same mutual information matrix as `_get_mutual_info_fast` for bit-string samples.
+
+        The joint counts of every pair of bit positions are derived from a single product of the 0/1 sample matrix with
+        itself, instead of from one boolean mask per pair of values.
+        """
+        len_sample_kept = self.keep_sample.shape[0]
+        ones = (self.keep_sample == 1).astype(np.float64)
+
+        # count_11[i, j] is the number of kept samples with both bit i and bit j set; its diagonal holds the bit counts
+        count_11 = ones.T @ ones
+        count_1 = np.diag(count_11)
+        count_0 = len_sample_kept - count_1
+
+        joint_counts = (
+            (count_11, count_1, count_1),
+            (count_1[:, None] - count_11, count_1, count_0),
+            (count_1[None, :] - count_11, count_0, count_1),
+            (len_sample_kept - count_1[:, None] - count_1[None, :] + count_11, count_0, count_0),
+        )
+
+        mutual_info = np.zeros([self.length, self.length])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for coeff, row_count, col_count in joint_counts:
+                temp = np.log(coeff * len_sample_kept / np.outer(row_count, col_count))
+                mutual_info += np.where(coeff > 0, temp * coeff / len_sample_kept, 0.0)
+
+        return -np.triu(mutual_info, k=1)
+
     def find_neighbors(self) -> None:
         """Find all neighbors of the current state."""
         self.neighbors = []
@@ -234,7 +302,7 @@ class DiscreteOpt(_OptProb):
             inds = []
 
             if len(last) == 0:
-                inds = [np.random.choice(list(set(np.arange(self.length)) - set(sample_order)))]
+                inds = [self._random.choice(list(set(np.arange(self.length)) - set(sample_order)))]
             else:
                 for i in last:
                     inds += list(np.where(parent == i)[0] + 1)
@@ -287,7 +355,8 @@ class DiscreteOpt(_OptProb):
         np.ndarray
             Randomly generated state vector.
         """
-        return np.random.randint(0, self.max_val, self.length)
+        # Drawing directly in the problem's dtype avoids allocating an int64 state only to cast and discard it
+        return self._random_integers(0, self.max_val, self.length, dtype=self.dtype)
 
     def random_neighbor(self) -> np.ndarray:
         """Return random neighbor of current state vector.
@@ -298,14 +367,14 @@ class DiscreteOpt(_OptProb):
             State vector of random neighbor.
         """
         neighbor = np.copy(self.state)
-        i = np.random.randint(0, self.length)
+        i = self._random_integers(0, self.length)
 
         if self.max_val == 2:
             neighbor[i] = np.abs(neighbor[i] - 1)
         else:
             vals = list(np.arange(self.max_val))
             vals.remove(neighbor[i])
-            neighbor[i] = vals[np.random.randint(0, self.max_val - 1)]
+            neighbor[i] = vals[self._random_integers(0, self.max_val - 1)]
 
         return neighbor
 
@@ -320,17 +389,8 @@ class DiscreteOpt(_OptProb):
         if pop_size <= 0:
             raise ValueError("pop_size must be a positive integer.")
 
-        population = []
-        pop_fitness = []
-
-        for _ in range(pop_size):
-            state = self.random()
-            population.append(state)
-            fitness = self.eval_fitness(state)
-            pop_fitness.append(fitness)
-
-        self.population = np.array(population)
-        self.pop_fitness = np.array(pop_fitness)
+        self.population = np.array([self.random() for _ in range(pop_size)])
+        self.evaluate_population_fitness()
 
     def reproduce(self, parent_1: np.ndarray, parent_2: np.ndarray, mutation_prob: float = 0.1) -> np.ndarray:
         """Create child state vector from two parent state vectors.
@@ -382,17 +442,20 @@ class DiscreteOpt(_OptProb):
         if sample_size <= 0:
             raise ValueError(f"sample_size must be a positive integer, got {sample_size}.")
 
-        new_sample = np.zeros([sample_size, self.length])
-        new_sample[:, 0] = np.random.choice(self.max_val, sample_size, p=self.node_probs[0, 0])
+        new_sample = np.zeros([sample_size, self.length], dtype=self.dtype)
+
+        # Each element is drawn by inverting its conditional CDF (given its parent's value) at a uniform variate: the
+        # sampled value is the number of CDF steps below the variate. thresholds[i, k, j] = P(x_i <= k | parent = j).
+        thresholds = np.cumsum(self.node_probs, axis=2)[:, :, :-1].transpose(0, 2, 1).copy()
+        uniforms = self._random.random((self.length, sample_size))
+
+        new_sample[:, 0] = np.sum(uniforms[0] >= thresholds[0][:, [0]], axis=0)
 
         self.find_sample_order()
         sample_order = self.sample_order[1:]
 
         for i in sample_order:
-            par_ind = self.parent_nodes[i - 1]
-
-            for j in range(self.max_val):
-                inds = np.where(new_sample[:, par_ind] == j)[0]
-                new_sample[inds, i] = np.random.choice(self.max_val, len(inds), p=self.node_probs[i, j])
+            parent_values = new_sample[:, self.parent_nodes[i - 1]].astype(np.intp)
+            new_sample[:, i] = np.sum(uniforms[i] >= thresholds[i][:, parent_values], axis=0)
 
         return new_sample
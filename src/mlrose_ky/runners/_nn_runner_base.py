@@ -82,6 +82,7 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
         override_ctrl_c_handler: bool = True,
         n_jobs: int = 1,
         replay: bool = False,
+        output_format: str = "csv",
         **kwargs,
     ):
         """
@@ -121,6 +122,8 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
             Number of parallel jobs for grid search.
         replay : bool, optional, default=False
             Whether to replay previous results.
+        output_format : str, optional, default="csv"
+            Format of the tabular result files, either "csv" or "parquet". Parquet requires pyarrow.
         **kwargs :
             Additional hyperparameters for grid search.
         """
@@ -134,6 +137,7 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
             replay=replay,
             override_ctrl_c_handler=override_ctrl_c_handler,
             copy_zero_curve_fitness_from_first=True,
+            output_format=output_format,
         )
 
         GridSearchMixin.__init__(self, scorer_method=grid_search_scorer_method)
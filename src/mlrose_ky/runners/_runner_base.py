@@ -3,6 +3,7 @@
 # Authors: Andrew Rollings (modified by Kyle Nakamura)
 # License: BSD 3-clause
 
+import bisect
 import copy
 import ctypes
 import inspect
@@ -14,22 +15,145 @@ import pickle as pk
 import signal
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 
 from mlrose_ky.decorators import get_short_name
 from mlrose_ky.runners.utils import build_data_filename
 
 
+class _CachedFitness:
+    """
+    Wrapper that memoizes the fitness of bit-string states.
+
+    States are keyed by their bit-packed bytes, so the wrapper is only valid for deterministic fitness functions of binary
+    (`max_val = 2`) state vectors. The least recently used entries are evicted once the cache reaches `max_size` entries.
+    All other attribute lookups are forwarded to the wrapped fitness function.
+
+    Parameters
+    ----------
+    fitness_fn : Any
+        Fitness function object to wrap.
+    max_size : int, optional, default=2**18
+        Maximum number of cached fitness values.
+
+    Attributes
+    ----------
+    fitness_fn : Any
+        The wrapped fitness function.
+    max_size : int
+        Maximum number of cached fitness values.
+    """
+
+    def __init__(self, fitness_fn: Any, max_size: int = 2**18):
+        self.fitness_fn: Any = fitness_fn
+        self.max_size: int = max_size
+        self._cache: OrderedDict[bytes, float] = OrderedDict()
+
+    def __getattr__(self, name: str) -> Any:
+        fitness_fn = self.__dict__.get("fitness_fn")
+        if fitness_fn is None:
+            raise AttributeError(name)
+
+        return getattr(fitness_fn, name)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self):
+        """Discard all cached fitness values."""
+        self._cache.clear()
+
+    def _lookup(self, key: bytes) -> float | None:
+        """Return the cached fitness for a key, or None on a miss."""
+        fitness = self._cache.get(key)
+        if fitness is not None:
+            self._cache.move_to_end(key)
+
+        return fitness
+
+    def _store(self, key: bytes, fitness: float):
+        """Cache a fitness value, evicting the least recently used entry if the cache is full."""
+        self._cache[key] = fitness
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def evaluate(self, state: np.ndarray) -> float:
+        """
+        Evaluate the fitness of a state vector, reusing a cached value if available.
+
+        Parameters
+        ----------
+        state : np.ndarray
+            State array for evaluation.
+
+        Returns
+        -------
+        float
+            Value of the fitness function.
+        """
+        key = np.packbits(state.astype(np.uint8)).tobytes()
+
+        fitness = self._lookup(key)
+        if fitness is None:
+            fitness = self.fitness_fn.evaluate(state)
+            self._store(key, fitness)
+
+        return fitness
+
+    def evaluate_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the fitness of every state vector in a population, reusing cached values where available.
+
+        Misses are evaluated with the wrapped fitness function's `evaluate_batch` method if it has one.
+
+        Parameters
+        ----------
+        states : np.ndarray
+            2D array whose rows are state vectors.
+
+        Returns
+        -------
+        np.ndarray
+            1D array of fitness values, one per row of `states`.
+        """
+        packed = np.packbits(states.astype(np.uint8), axis=1)
+        keys = [row.tobytes() for row in packed]
+
+        pop_fitness = np.empty(len(keys))
+        misses = []
+        for i, key in enumerate(keys):
+            fitness = self._lookup(key)
+            if fitness is None:
+                misses.append(i)
+            else:
+                pop_fitness[i] = fitness
+
+        if misses:
+            evaluate_batch = getattr(self.fitness_fn, "evaluate_batch", None)
+            if evaluate_batch is not None:
+                miss_fitness = evaluate_batch(states[misses])
+            else:
+                miss_fitness = [self.fitness_fn.evaluate(states[i]) for i in misses]
+
+            for i, fitness in zip(misses, miss_fitness):
+                pop_fitness[i] = fitness
+                self._store(keys[i], float(fitness))
+
+        return pop_fitness
+
+
 class _RunnerBase(ABC):
     """
     Abstract base class for running and managing optimization experiments.
 
     This class provides a framework for setting up, running, and managing the lifecycle
     of optimization experiments. It handles tasks such as logging, error handling,
-    signal interruption, dynamic naming, and result saving to both pickle and CSV files.
+    signal interruption, dynamic naming, and result saving to pickle and CSV (or Parquet) files.
     The class is designed to be extended by concrete subclasses that implement the
     `run` method, which defines the specific behavior of the experiment.
 
@@ -65,6 +189,8 @@ class _RunnerBase(ABC):
         copy_zero_curve_fitness_from_first: bool = False,
         replay: bool = False,
         override_ctrl_c_handler: bool = True,
+        n_jobs: int = 1,
+        output_format: str = "csv",
         **kwargs: Any,
     ):
         """
@@ -93,6 +219,15 @@ class _RunnerBase(ABC):
             Whether to enable replay mode, default=False.
         override_ctrl_c_handler : bool, optional, default=True
             Whether to override the Ctrl-C signal handler.
+        n_jobs : int, optional, default=1
+            Number of grid points to run concurrently in separate processes. -1 uses all available cores. The parallel
+            Numba batch kernels start their own threads inside each worker (see `numba.set_num_threads`), so limit
+            those when running many workers. Completed grid points are checkpointed as they come back, and a Ctrl-C
+            keeps them, but grid points still running in the workers are lost.
+        output_format : str, optional, default="csv"
+            Format of the tabular files written next to the pickles in `output_directory`, either "csv" or "parquet".
+            Parquet files are zstd-compressed and require pyarrow (the `parquet` extra); if it cannot be imported, an
+            ImportError is raised here rather than when results are first saved.
         **kwargs : Any
             Additional keyword arguments for experiment configuration.
         """
@@ -103,6 +238,20 @@ class _RunnerBase(ABC):
         self.generate_curves: bool = generate_curves
         self.parameter_description_dict: dict[str, str] = {}
         self.override_ctrl_c_handler: bool = override_ctrl_c_handler
+        self.n_jobs: int = n_jobs
+
+        if output_format not in ("csv", "parquet"):
+            raise ValueError(f"output_format must be 'csv' or 'parquet', got {output_format!r}.")
+        if output_format == "parquet":
+            # Fail here rather than at the first checkpoint save, partway into a run
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "output_format='parquet' requires pyarrow, which could not be imported. "
+                    "Install it with `pip install mlrose-ky[parquet]`, or use output_format='csv'."
+                ) from e
+        self.output_format: str = output_format
 
         # Initialize output and state-tracking variables
         self.run_stats_df: pd.DataFrame | None = None
@@ -120,6 +269,9 @@ class _RunnerBase(ABC):
         self._run_start_time: float | None = None
         self._iteration_times: list[float] = []
         self._first_curve_synthesized: bool = False
+        self._grid_index: int = 0
+        self._checkpoint_iterations: list[int] = sorted({int(i) for i in iteration_list})
+        self._checkpoint_iteration_set: set[int] = set(self._checkpoint_iterations)
 
         if replay:
             self.set_replay_mode()
@@ -206,6 +358,8 @@ class _RunnerBase(ABC):
 
         self._iteration_times = []
         self._copy_zero_curve_fitness_from_first = self._copy_zero_curve_fitness_from_first_original
+        self._checkpoint_iterations = sorted({int(i) for i in self.iteration_list})
+        self._checkpoint_iteration_set = set(self._checkpoint_iterations)
         self._current_logged_algorithm_args.clear()
 
         # Create the output directory if it doesn't exist
@@ -282,13 +436,27 @@ class _RunnerBase(ABC):
         logging.info(f"Running {self.dynamic_runner_name()}")
         run_start = time.perf_counter()
 
+        grid_args = []
         for value_set in value_sets:
             total_args = dict(value_set)
 
             if "max_iters" not in total_args:
                 total_args["max_iters"] = int(max(self.iteration_list))
 
-            self._run_one_experiment(algorithm, total_args)
+            grid_args.append(total_args)
+
+        # Each grid point replaces the problem's generator with its own, so the caller's generator is restored afterwards
+        rng = getattr(self.problem, "rng", None)
+        try:
+            if self.n_jobs == 1 or len(grid_args) <= 1 or self.replay_mode():
+                for grid_index, total_args in enumerate(grid_args):
+                    self._grid_index = grid_index
+                    self._run_one_experiment(algorithm, total_args)
+            else:
+                self._run_experiments_in_parallel(algorithm, grid_args)
+        finally:
+            if isinstance(rng, np.random.Generator):
+                self.problem.rng = rng
 
         run_end = time.perf_counter()
         logging.info(f"Run time: {run_end - run_start:.2f} seconds")
@@ -325,6 +493,44 @@ class _RunnerBase(ABC):
             **total_args,
         )
 
+    def _run_experiments_in_parallel(self, algorithm: Any, grid_args: list[dict[str, Any]]):
+        """
+        Execute every grid point of the experiment in worker processes and merge their results in grid order.
+
+        The workers do not write checkpoints, so each grid point is merged and checkpointed here as soon as it comes
+        back. A Ctrl-C caught by the runner's handler stops the run once the next grid point returns, keeping every grid
+        point that has already finished; grid points still running in the workers are lost.
+
+        Parameters
+        ----------
+        algorithm : Any
+            The algorithm to run.
+        grid_args : list[dict[str, Any]]
+            The arguments passed to the algorithm for each grid point.
+        """
+        results = Parallel(n_jobs=self.n_jobs, return_as="generator")(
+            delayed(_run_grid_point)(self, algorithm, total_args, grid_index) for grid_index, total_args in enumerate(grid_args)
+        )
+
+        try:
+            for run_stats, fitness_curves in results:
+                self._raw_run_stats.extend(run_stats)
+                self._fitness_curves.extend(fitness_curves)
+                self._curve_base = len(self._fitness_curves)
+
+                if self._output_directory is not None:
+                    self._create_and_save_run_data_frames()
+
+                if self.has_aborted():
+                    break
+        except BaseException:
+            # Ctrl-C also reaches the worker processes, whose failure surfaces here; once the run has been aborted, the
+            # grid points merged so far are kept and saved like those of an interrupted sequential run
+            if not self.has_aborted():
+                raise
+        finally:
+            results.close()
+
     def _create_and_save_run_data_frames(self, extra_data_frames: dict[str, pd.DataFrame] = None, final_save: bool = False):
         """
         Save the collected run statistics and fitness curves to disk.
@@ -352,7 +558,7 @@ class _RunnerBase(ABC):
 
     def _dump_df_to_disk(self, df: pd.DataFrame, df_name: str, final_save: bool = False):
         """
-        Save the DataFrame to disk as both a pickle and CSV file.
+        Save the DataFrame to disk as both a pickle and a CSV or Parquet file, depending on `output_format`.
 
         Parameters
         ----------
@@ -364,10 +570,18 @@ class _RunnerBase(ABC):
             Whether this is the final save (default False).
         """
         filename_root = self._dump_pickle_to_disk(object_to_pickle=df, name=df_name)
-        df.to_csv(f"{filename_root}.csv")
+
+        if self.output_format == "parquet":
+            filename = f"{filename_root}.parquet"
+            # Object columns (states, schedules, ...) are stored as their string form, as they would appear in a CSV.
+            object_columns = df.select_dtypes(include="object").columns
+            df.astype({column: str for column in object_columns}).to_parquet(filename, compression="zstd")
+        else:
+            filename = f"{filename_root}.csv"
+            df.to_csv(filename)
 
         if final_save:
-            logging.info(f"Saved: [{filename_root}.csv]")
+            logging.info(f"Saved: [{filename}]")
 
     def _get_pickle_filename_root(self, name: str) -> str:
         """Generate the root filename for the pickle file based on experiment metadata."""
@@ -486,6 +700,11 @@ class _RunnerBase(ABC):
         self._print_banner("*** Run START ***")
         np.random.seed(self.seed)
 
+        # A problem with its own generator gets the grid point's child of SeedSequence(seed), so every grid point has an
+        # independent stream that is the same whether the grid points run sequentially or in parallel worker processes
+        if isinstance(getattr(problem, "rng", None), np.random.Generator):
+            problem.rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(self._grid_index,)))
+
         # Filter arguments to those accepted by the algorithm function signature
         valid_args = [k for k in inspect.signature(algorithm).parameters]
         kwargs = {k: v for k, v in total_args.items() if k in valid_args}
@@ -593,7 +812,7 @@ class _RunnerBase(ABC):
         self._iteration_times.append(t)
 
         # Skip logging for non-final iterations not in the list
-        if iteration > 0 and iteration not in self.iteration_list and not done:
+        if iteration > 0 and iteration not in self._checkpoint_iteration_set and not done:
             return True
 
         # Update logging with current algorithm and user data
@@ -635,8 +854,8 @@ class _RunnerBase(ABC):
 
         # Determine which iterations to log
         if iteration > 0:
-            remaining_iterations = [i for i in self.iteration_list if i >= iteration]
-            iterations = [min(remaining_iterations)] if not done else remaining_iterations
+            remaining_iterations = self._checkpoint_iterations[bisect.bisect_left(self._checkpoint_iterations, iteration) :]
+            iterations = remaining_iterations[:1] if not done else remaining_iterations
         else:
             iterations = [0]
 
@@ -683,6 +902,45 @@ class _RunnerBase(ABC):
             if self._copy_zero_curve_fitness_from_first and len(self._fitness_curves) > 1:
                 self._fitness_curves[0]["Fitness"] = self._fitness_curves[1]["Fitness"]
                 self._copy_zero_curve_fitness_from_first = False
-            self._create_and_save_run_data_frames()
+
+            # Checkpoint progress to disk. Without an output directory there is nothing to checkpoint, and rebuilding the
+            # data frames from every row collected so far on each save would make a run quadratic in its length.
+            if self._output_directory is not None:
+                self._create_and_save_run_data_frames()
 
         return not (self.has_aborted() or done)
+
+
+def _run_grid_point(
+    runner: _RunnerBase, algorithm: Any, total_args: dict[str, Any], grid_index: int
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Run a single grid point on a worker's copy of a runner and return the statistics it collected.
+
+    Parameters
+    ----------
+    runner : _RunnerBase
+        The worker's copy of the runner.
+    algorithm : Any
+        The algorithm to run.
+    total_args : dict[str, Any]
+        The arguments passed to the algorithm.
+    grid_index : int
+        Position of the grid point in the experiment's grid.
+
+    Returns
+    -------
+    tuple[list[dict[str, Any]], list[dict[str, Any]]]
+        The raw run statistics and fitness curves for the grid point.
+    """
+    # The parent process saves the merged results, so the worker must not write partial results to disk
+    runner._output_directory = None
+    runner._raw_run_stats = []
+    runner._fitness_curves = []
+    runner._curve_base = 0
+    runner._grid_index = grid_index
+    runner._copy_zero_curve_fitness_from_first = runner._copy_zero_curve_fitness_from_first and grid_index == 0
+
+    runner._run_one_experiment(algorithm, total_args)
+
+    return runner._raw_run_stats, runner._fitness_curves
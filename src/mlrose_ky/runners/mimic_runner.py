@@ -25,9 +25,10 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from mlrose_ky.algorithms import mimic
+from mlrose_ky.algorithms import mimic, mimic_binary
 from mlrose_ky.decorators import short_name
-from mlrose_ky.runners._runner_base import _RunnerBase
+from mlrose_ky.fitness import CustomFitness
+from mlrose_ky.runners._runner_base import _RunnerBase, _CachedFitness
 
 
 @short_name("mimic")
@@ -61,6 +62,7 @@ class MIMICRunner(_RunnerBase):
         generate_curves: bool = True,
         use_fast_mimic: bool = True,
         output_directory: str = None,
+        n_jobs: int = 1,
         **kwargs: Any,
     ):
         """
@@ -85,9 +87,15 @@ class MIMICRunner(_RunnerBase):
         generate_curves : bool, optional
             Whether to generate learning curves.
         use_fast_mimic : bool, optional
-            Whether to use the fast MIMIC mode, if available.
+            Whether to use the fast MIMIC mode, if available. For bit-string problems whose fitness function is one of the
+            built-in classes from `mlrose_ky.fitness` (other than CustomFitness) and has no batch evaluation, this also
+            caches fitness values during `run` so that repeated samples are not re-evaluated. User-defined fitness
+            functions are never cached, since they may not be deterministic.
         output_directory : str, optional
             Directory to save experiment result, default=None.
+        n_jobs : int, optional
+            Number of grid points to run concurrently in separate processes, default=1. -1 uses all available cores.
+            The parallel Numba batch kernels start their own threads inside each worker (see `numba.set_num_threads`).
         """
         super().__init__(
             problem=problem,
@@ -97,6 +105,7 @@ class MIMICRunner(_RunnerBase):
             max_attempts=max_attempts,
             generate_curves=generate_curves,
             output_directory=output_directory,
+            n_jobs=n_jobs,
             **kwargs,
         )
         self.keep_percent_list: list[float] = keep_percent_list
@@ -104,9 +113,10 @@ class MIMICRunner(_RunnerBase):
         self._use_fast_mimic: bool | None = None
 
         # Set fast MIMIC mode if available
-        if hasattr(problem, "set_mimic_fast_mode") and callable(getattr(problem, "set_mimic_fast_mode")):
+        set_mimic_fast_mode = getattr(problem, "set_mimic_fast_mode", None)
+        if callable(set_mimic_fast_mode):
             self._use_fast_mimic = use_fast_mimic
-            problem.set_mimic_fast_mode(use_fast_mimic)
+            set_mimic_fast_mode(use_fast_mimic)
 
     def _setup(self):
         """
@@ -125,12 +135,31 @@ class MIMICRunner(_RunnerBase):
 
         This method performs grid search over the provided population sizes
         and keep percentages and returns the statistics and curves generated by the experiment.
+        In fast MIMIC mode, bit-string problems whose fitness function declares `is_binary` are solved with
+        `mimic_binary`, and built-in fitness functions from `mlrose_ky.fitness` without a native `evaluate_batch` are
+        wrapped in a fitness cache for the duration of the run. The problem's own fitness function is restored afterwards.
 
         Returns
         -------
         tuple
             A tuple containing two DataFrames: run statistics and run curves
         """
-        return super().run_experiment_(
-            algorithm=mimic, pop_size=("Population Size", self.population_sizes), keep_pct=("Keep Percent", self.keep_percent_list)
-        )
+        fitness_fn = self.problem.fitness_fn
+        bit_string = self._use_fast_mimic and getattr(self.problem, "max_val", None) == 2
+
+        algorithm = mimic
+        if bit_string and getattr(fitness_fn, "is_binary", False):
+            algorithm = mimic_binary
+
+        # Only the library's own fitness classes are known to be deterministic, so user-defined ones are never cached.
+        # A native batch kernel is faster than any per-row cache lookup, so only fitness functions without one are cached.
+        built_in = type(fitness_fn).__module__.startswith("mlrose_ky.fitness.") and not isinstance(fitness_fn, CustomFitness)
+        if bit_string and built_in and getattr(fitness_fn, "evaluate_batch", None) is None:
+            self.problem.fitness_fn = _CachedFitness(fitness_fn)
+
+        try:
+            return super().run_experiment_(
+                algorithm=algorithm, pop_size=("Population Size", self.population_sizes), keep_pct=("Keep Percent", self.keep_percent_list)
+            )
+        finally:
+            self.problem.fitness_fn = fitness_fn
@@ -77,6 +77,7 @@ class NNGSRunner(_NNRunnerBase):
         cv: int = 5,
         generate_curves: bool = True,
         output_directory: str = None,
+        output_format: str = "csv",
         **kwargs: Any,
     ):
         """
@@ -120,6 +121,8 @@ class NNGSRunner(_NNRunnerBase):
             Whether to generate learning curves.
         output_directory : str, optional
             Directory to save output.
+        output_format : str, optional
+            Format of the tabular result files, either "csv" or "parquet". Parquet requires pyarrow.
         """
         # Take a copy of the grid search parameters
         grid_search_parameters = {**grid_search_parameters}
@@ -143,6 +146,7 @@ class NNGSRunner(_NNRunnerBase):
             n_jobs=n_jobs,
             cv=cv,
             grid_search_scorer_method=grid_search_scorer_method,
+            output_format=output_format,
             **kwargs,
         )
 
@@ -191,6 +191,7 @@ class SKMLPRunner(_NNRunnerBase):
         generate_curves: bool = True,
         output_directory: str = None,
         replay: bool = False,
+        output_format: str = "csv",
         **kwargs: Any,
     ):
         """
@@ -232,6 +233,8 @@ class SKMLPRunner(_NNRunnerBase):
             Directory to save output.
         replay : bool, optional
             Whether to replay the experiment.
+        output_format : str, optional
+            Format of the tabular result files, either "csv" or "parquet". Parquet requires pyarrow.
         """
         grid_search_parameters = {**grid_search_parameters}
 
@@ -258,6 +261,7 @@ class SKMLPRunner(_NNRunnerBase):
             replay=replay,
             n_jobs=n_jobs,
             cv=cv,
+            output_format=output_format,
         )
 
         # Create a dictionary of default values
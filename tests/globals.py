@@ -6,13 +6,21 @@ import numpy as np
 SEED = 12
 
 
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Return a C-contiguous copy of `array` that cannot be modified in place."""
+    array = np.ascontiguousarray(array)
+    array.setflags(write=False)
+    return array
+
+
+# Sample data is built once at import time and shared by every test; it is read-only so no test can alter it for others
+SAMPLE_X = _read_only([[0, 1, 0, 1], [0, 0, 0, 0], [1, 1, 1, 1], [1, 1, 1, 1], [0, 0, 1, 1], [1, 0, 0, 0]])  # shape = (6, 4)
+SAMPLE_Y_CLASSIFIER = _read_only([[1], [1], [0], [0], [1], [1]])  # shape = (6, 1)
+SAMPLE_Y_MULTICLASS = _read_only([[1, 1], [1, 0], [0, 0], [0, 0], [1, 0], [1, 1]])  # shape = (6, 2)
+SAMPLE_Y_REGRESSOR = SAMPLE_Y_CLASSIFIER
+
+
 @pytest.fixture
 def sample_data():
     """Return sample data for testing."""
-    X = np.array([[0, 1, 0, 1], [0, 0, 0, 0], [1, 1, 1, 1], [1, 1, 1, 1], [0, 0, 1, 1], [1, 0, 0, 0]])  # X.shape = (6, 4)
-
-    y_classifier = np.reshape(np.array([1, 1, 0, 0, 1, 1]), (X.shape[0], 1))
-    y_multiclass = np.array([[1, 1], [1, 0], [0, 0], [0, 0], [1, 0], [1, 1]])
-    y_regressor = y_classifier.copy()
-
-    return X, y_classifier, y_multiclass, y_regressor
+    return SAMPLE_X, SAMPLE_Y_CLASSIFIER, SAMPLE_Y_MULTICLASS, SAMPLE_Y_REGRESSOR
@@ -8,7 +8,7 @@ import pytest
 import re
 
 from mlrose_ky import DiscreteOpt, ContinuousOpt, OneMax, CustomFitness
-from mlrose_ky.algorithms import mimic
+from mlrose_ky.algorithms import mimic, mimic_binary
 from tests.globals import SEED
 
 
@@ -101,3 +101,18 @@ class TestMimic:
         # Since can_stop() returns True, the algorithm should terminate immediately
         assert isinstance(best_state, np.ndarray)
         assert isinstance(best_fitness, float)
+
+    def test_mimic_binary_max_one(self):
+        """Test mimic_binary solves a bit-string problem and restores the problem's mutual information estimate."""
+        problem = DiscreteOpt(5, OneMax())
+        problem.set_mimic_fast_mode(True)
+        best_state, best_fitness, _ = mimic_binary(problem, max_attempts=50, random_state=SEED)
+
+        assert np.array_equal(best_state, np.ones(5)) and best_fitness == 5
+        assert problem._get_mutual_info_impl == problem._get_mutual_info_fast
+
+    def test_mimic_binary_invalid_problem(self):
+        """Test that mimic_binary raises ValueError for problems that are not bit strings."""
+        problem = DiscreteOpt(5, OneMax(), max_val=3)
+        with pytest.raises(ValueError, match=re.escape("mimic_binary can only be used for bit-string")):
+            mimic_binary(problem, random_state=SEED)
@@ -62,3 +62,57 @@ class TestContinousPeaks:
         """Test ContinuousPeaks fitness function for case when R > 0."""
         state = np.array([0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1])
         assert ContinuousPeaks(t_pct=0.15).evaluate(state) == 17
+
+    def test_continuouspeaks_matches_max_run(self):
+        """Test ContinuousPeaks fitness function agrees with max_run on random bit strings."""
+        rng = np.random.default_rng(12)
+        fitness = ContinuousPeaks(t_pct=0.1)
+        for size in [1, 7, 20, 64, 65, 200]:
+            for _ in range(20):
+                state = rng.integers(0, 2, size)
+                threshold = int(np.ceil(0.1 * size))
+                max_zeros = ContinuousPeaks.max_run(0, state)
+                max_ones = ContinuousPeaks.max_run(1, state)
+                reward = size if max_zeros > threshold and max_ones > threshold else 0
+                assert fitness.evaluate(state) == max(max_zeros, max_ones) + reward
+
+    def test_continuouspeaks_float_state(self):
+        """Test ContinuousPeaks fitness function for a float-valued state."""
+        state = np.array([0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1], dtype=float)
+        assert ContinuousPeaks(t_pct=0.15).evaluate(state) == 17
+
+    def test_continuouspeaks_evaluate_batch(self):
+        """Test ContinuousPeaks evaluate_batch agrees with evaluate row by row."""
+        rng = np.random.default_rng(12)
+        fitness = ContinuousPeaks(t_pct=0.15)
+        for size in [1, 12, 64, 100]:
+            states = rng.integers(0, 2, (50, size))
+            expected = np.array([fitness.evaluate(state) for state in states])
+            assert np.array_equal(fitness.evaluate_batch(states), expected)
+
+    def test_continuouspeaks_evaluate_batch_invalid_states(self):
+        """Test that ContinuousPeaks evaluate_batch raises errors for invalid states."""
+        with pytest.raises(TypeError, match=re.escape("Expected states to be np.ndarray, got list instead.")):
+            # noinspection PyTypeChecker
+            ContinuousPeaks().evaluate_batch([[0, 1], [1, 0]])
+        with pytest.raises(ValueError, match=re.escape("Expected states to be a 2D array, got 1 dimensions instead.")):
+            ContinuousPeaks().evaluate_batch(np.array([0, 1, 1]))
+
+    def test_continuouspeaks_non_binary_values_break_runs(self):
+        """Test ContinuousPeaks fitness function treats values other than 0 and 1 as run breaks."""
+        state = np.array([1, 1, 1, 1, 0, 1, 0, 2, 1, 1, 1, 1, 1, 4, 6, 1, 1])
+        assert ContinuousPeaks(t_pct=0.15).evaluate(state) == 5
+        assert ContinuousPeaks(t_pct=0.15).evaluate(np.tile(state, 5)) == 6
+
+    def test_continuouspeaks_values_outside_int8(self):
+        """Test ContinuousPeaks does not let values that wrap or truncate in int8 turn into 0 or 1."""
+        fitness = ContinuousPeaks(t_pct=0.15)
+        # In int8, 256 would wrap to 0 and 0.4 would truncate to 0, giving 18 and 16 (with the reward) instead
+        for state, expected in [(np.array([0, 0, 256, 256, 0, 0, 1, 1, 1, 1, 1, 1]), 6), (np.array([0.4] * 4 + [1] * 4 + [0.4] * 4), 4)]:
+            assert fitness.evaluate(state) == expected
+            assert np.array_equal(fitness.evaluate_batch(np.vstack([state, state])), [expected, expected])
+
+    def test_continuouspeaks_bool_state(self):
+        """Test ContinuousPeaks evaluates boolean states like their 0/1 equivalents."""
+        state = np.array([0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1])
+        assert ContinuousPeaks(t_pct=0.15).evaluate(state.astype(bool)) == ContinuousPeaks(t_pct=0.15).evaluate(state)
@@ -5,7 +5,7 @@ import numpy as np
 
 from tests.globals import SEED
 
-from mlrose_ky import ContinuousPeaks, DiscreteOpt
+from mlrose_ky import ContinuousPeaks, DiscreteOpt, genetic_alg, mimic, random_hill_climb, simulated_annealing
 from mlrose_ky.generators import ContinuousPeaksGenerator
 
 
@@ -81,3 +81,45 @@ class TestContinuousPeaksGenerator:
 
         assert problem.length == size
         assert problem.fitness_fn.t_pct == t_pct
+
+    @pytest.mark.parametrize("algorithm", [mimic, genetic_alg, random_hill_climb, simulated_annealing])
+    def test_generate_reproducible_with_random_state(self, algorithm):
+        """Test algorithms give identical results on a generated problem when run twice with the same random_state"""
+        problem = ContinuousPeaksGenerator.generate(seed=1, size=30)
+        results = [algorithm(problem, max_attempts=5, max_iters=20, random_state=7, curve=True) for _ in range(2)]
+
+        assert problem.rng is None
+        assert np.array_equal(results[0][0], results[1][0])
+        assert results[0][1] == results[1][1]
+        assert np.array_equal(results[0][2], results[1][2])
+
+    def test_generate_numeric_types(self):
+        """Test generate method accepts integer and NumPy scalar arguments"""
+        problem = ContinuousPeaksGenerator.generate(seed=SEED, size=np.int64(12), t_pct=1)
+
+        assert problem.length == 12
+        assert problem.fitness_fn.t_pct == 1.0
+
+        problem = ContinuousPeaksGenerator.generate(seed=SEED, size=12, t_pct=np.float32(0.5))
+
+        assert problem.fitness_fn.t_pct == 0.5
+
+    def test_generate_shares_fitness(self):
+        """Test generate method reuses the fitness function for repeated threshold percentages"""
+        problem_1 = ContinuousPeaksGenerator.generate(seed=SEED, t_pct=0.3)
+        problem_2 = ContinuousPeaksGenerator.generate(seed=SEED + 1, t_pct=0.3)
+        problem_3 = ContinuousPeaksGenerator.generate(seed=SEED, t_pct=0.4)
+
+        assert problem_1.fitness_fn is problem_2.fitness_fn
+        assert problem_1.fitness_fn is not problem_3.fitness_fn
+
+    def test_generate_independent_problems(self):
+        """Test generate method returns independent problems that only share the fitness function"""
+        problem_1 = ContinuousPeaksGenerator.generate(seed=SEED)
+        problem_2 = ContinuousPeaksGenerator.generate(seed=SEED)
+
+        assert problem_1 is not problem_2
+        assert problem_1.fitness_fn is problem_2.fitness_fn
+
+        problem_1.set_state(np.ones(problem_1.length))
+        assert not np.array_equal(problem_1.get_state(), problem_2.get_state())
@@ -82,6 +82,24 @@ class TestNeuralOptimizationFunctions:
         for w, ew in zip(weights, expected_output):
             assert np.array_equal(w, ew)
 
+    def test_flatten_weights_round_trip(self):
+        weights = [np.random.rand(3, 4), np.random.rand(4, 2)]
+        flat_weights = flatten_weights(weights)
+
+        assert isinstance(flat_weights, np.ndarray)
+        assert flat_weights.dtype == np.float64
+        assert flat_weights.shape == (20,)
+
+        for w, ew in zip(unflatten_weights(flat_weights, [3, 4, 2]), weights):
+            assert np.array_equal(w, ew)
+
+    def test_unflatten_weights_views(self):
+        flat_weights = np.arange(6.0)
+        weights = unflatten_weights(flat_weights, [2, 2, 1])
+
+        assert [w.shape for w in weights] == [(2, 2), (2, 1)]
+        assert all(np.shares_memory(w, flat_weights) for w in weights)
+
     def test_unflatten_weights_empty_array(self):
         flat_weights = np.array([])
         node_list = [2, 2, 1]
@@ -12,6 +12,7 @@ from mlrose_ky.opt_probs import ContinuousOpt
 from mlrose_ky.fitness import OneMax, CustomFitness
 from mlrose_ky.neural import NetworkWeights
 from mlrose_ky.neural.activation import identity
+from tests.globals import SAMPLE_X, SAMPLE_Y_CLASSIFIER
 
 
 class TestContinuousOpt:
@@ -42,10 +43,10 @@ class TestContinuousOpt:
 
     def test_calculate_updates(self):
         """Test calculate_updates method"""
-        X = np.array([[0, 1, 0, 1], [0, 0, 0, 0], [1, 1, 1, 1], [1, 1, 1, 1], [0, 0, 1, 1], [1, 0, 0, 0]])
-        y = np.reshape(np.array([1, 1, 0, 0, 1, 1]), [6, 1])
         nodes = [4, 2, 1]
-        fitness = NetworkWeights(X, y, nodes, activation=identity, bias=False, is_classifier=False, learning_rate=1)
+        fitness = NetworkWeights(
+            SAMPLE_X, SAMPLE_Y_CLASSIFIER, nodes, activation=identity, bias=False, is_classifier=False, learning_rate=1
+        )
 
         a = list(np.arange(8) + 1)
         b = list(0.01 * (np.arange(2) + 1))
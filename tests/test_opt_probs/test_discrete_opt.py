@@ -9,6 +9,7 @@ import pytest
 from mlrose_ky.opt_probs import DiscreteOpt
 from mlrose_ky.fitness import OneMax, CustomFitness
 from mlrose_ky.algorithms import OnePointCrossOver
+from tests.globals import SEED
 
 
 class TestDiscreteOpt:
@@ -136,6 +137,35 @@ class TestDiscreteOpt:
         rand = problem.random()
         assert len(rand) == 5 and max(rand) >= 0 and min(rand) <= 4
 
+    def test_random_with_rng(self):
+        """Test random method draws from the problem's rng without touching the global random state"""
+        np.random.seed(12)
+        global_state = np.random.get_state()[1].copy()
+        rand_1 = DiscreteOpt(20, OneMax(), rng=np.random.default_rng(12)).random()
+        rand_2 = DiscreteOpt(20, OneMax(), rng=np.random.default_rng(12)).random()
+        assert np.array_equal(rand_1, rand_2)
+        assert np.array_equal(np.random.get_state()[1], global_state)
+
+    def test_dtype(self):
+        """Test states and samples are stored with the requested dtype"""
+        problem = DiscreteOpt(5, OneMax(), dtype=np.int8)
+        pop = np.array([[0, 0, 0, 0, 1], [1, 0, 1, 0, 1], [1, 1, 1, 1, 0], [1, 0, 0, 0, 1], [0, 0, 0, 0, 0], [1, 1, 1, 1, 1]])
+        problem.keep_sample = pop
+        problem.eval_node_probs()
+        assert problem.get_state().dtype == np.int8
+        assert problem.random().dtype == np.int8
+        assert problem.sample_pop(10).dtype == np.int8
+
+        problem.random_pop(10)
+        assert problem.population.dtype == np.int8 and problem.population.flags["C_CONTIGUOUS"]
+
+    def test_dtype_invalid(self):
+        """Test that DiscreteOpt raises ValueError for a dtype that cannot hold max_val - 1"""
+        with pytest.raises(ValueError, match="dtype must be an integer type that can hold values up to 199. Got int8"):
+            DiscreteOpt(5, OneMax(), max_val=200, dtype=np.int8)
+        with pytest.raises(ValueError, match="dtype must be an integer type that can hold values up to 1. Got float32"):
+            DiscreteOpt(5, OneMax(), dtype=np.float32)
+
     def test_random_neighbor_max2(self):
         """Test random_neighbor method when max_val is equal to 2"""
         problem = DiscreteOpt(5, OneMax())
@@ -198,6 +228,20 @@ class TestDiscreteOpt:
         sample = problem.sample_pop(100)
         assert np.shape(sample)[0] == 100 and np.shape(sample)[1] == 5 and 0 < np.sum(sample) < 500
 
+    def test_sample_pop_follows_node_probs(self):
+        """Test sample_pop draws each element from its conditional distribution given its parent"""
+        problem = DiscreteOpt(2, OneMax(), max_val=3, rng=np.random.default_rng(12))
+        problem.parent_nodes = np.array([0])
+        problem.node_probs = np.array(
+            [[[0.2, 0.3, 0.5], [0.2, 0.3, 0.5], [0.2, 0.3, 0.5]], [[1.0, 0.0, 0.0], [0.0, 0.5, 0.5], [0.1, 0.0, 0.9]]]
+        )
+        sample = problem.sample_pop(20000)
+
+        assert np.allclose(np.bincount(sample[:, 0].astype(int), minlength=3) / 20000, [0.2, 0.3, 0.5], atol=0.02)
+        for parent_value, probs in enumerate(problem.node_probs[1]):
+            child_values = sample[sample[:, 0] == parent_value, 1].astype(int)
+            assert np.allclose(np.bincount(child_values, minlength=3) / len(child_values), probs, atol=0.03)
+
     def test_eval_node_probs_with_noise(self):
         """Test eval_node_probs method when noise > 0."""
         problem = DiscreteOpt(5, OneMax())
@@ -215,6 +259,19 @@ class TestDiscreteOpt:
         assert problem._mut_inf is None
         assert problem._get_mutual_info_impl == problem._get_mutual_info_slow
 
+    def test_get_mutual_info_binary(self):
+        """Test _get_mutual_info_binary method matches _get_mutual_info_fast on bit strings."""
+        problem = DiscreteOpt(8, OneMax())
+        problem.set_mimic_fast_mode(True)
+        problem.keep_sample = np.random.default_rng(SEED).integers(0, 2, (30, 8))
+        problem.keep_sample[:, 3] = 1  # A constant column has no mutual information with any other
+
+        mutual_info = problem._get_mutual_info_binary()
+
+        assert np.allclose(mutual_info, problem._get_mutual_info_fast())
+        assert np.all(mutual_info[np.tril_indices(8)] == 0)
+        assert np.all(mutual_info[3] == 0) and np.all(mutual_info[:, 3] == 0)
+
     def test_find_top_pct_invalid_keep_pct(self):
         """Test find_top_pct method with invalid keep_pct."""
         problem = DiscreteOpt(5, OneMax())
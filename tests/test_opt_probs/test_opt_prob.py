@@ -8,7 +8,7 @@ import re
 import numpy as np
 import pytest
 
-from mlrose_ky.fitness import OneMax
+from mlrose_ky.fitness import ContinuousPeaks, OneMax
 
 # noinspection PyProtectedMember
 from mlrose_ky.opt_probs._opt_prob import _OptProb
@@ -99,6 +99,14 @@ class TestOptProb:
         problem.set_population(pop)
         assert np.array_equal(problem.get_population(), pop) and np.array_equal(problem.get_pop_fitness(), pop_fit)
 
+    def test_set_population_evaluate_batch(self):
+        """Test set_population method uses the fitness function's evaluate_batch method when available"""
+        problem = _OptProb(12, ContinuousPeaks(t_pct=0.15), maximize=False)
+        pop = np.array([[0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1], [0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]])
+        problem.set_population(pop)
+        assert np.array_equal(problem.get_pop_fitness(), -np.array([17.0, 21.0]))
+        assert problem.fitness_evaluations == 2
+
     def test_best_child_max(self):
         """Test best_child method for a maximization problem"""
         problem = _OptProb(5, OneMax())
@@ -1,11 +1,13 @@
 """Unit tests for runners/ga_runner.py"""
 
+import numpy as np
+import pandas as pd
 import pytest
 from unittest.mock import patch
 
 from tests.globals import SEED
 
-from mlrose_ky import GARunner, FlipFlopGenerator
+from mlrose_ky import GARunner, FlipFlopGenerator, ContinuousPeaks, DiscreteOpt
 
 
 class TestGARunner:
@@ -110,3 +112,15 @@ class TestGARunner:
         assert runner.iteration_list == runner_kwargs["iteration_list"]
         assert runner.population_sizes == runner_kwargs["population_sizes"]
         assert runner.mutation_rates == runner_kwargs["mutation_rates"]
+
+    def test_parallel_run_matches_sequential_run(self, runner_kwargs):
+        """Test running grid points in parallel gives the same results as running them sequentially, with a problem rng."""
+        runner_kwargs.update({"max_attempts": 10})
+        results = []
+        for n_jobs in [1, 2]:
+            runner_kwargs["problem"] = DiscreteOpt(20, ContinuousPeaks(), rng=np.random.default_rng(SEED), dtype=np.int8)
+            run_stats, curves = GARunner(**runner_kwargs, n_jobs=n_jobs).run()
+            results.append((run_stats.drop(columns="Time"), curves.drop(columns="Time")))
+
+        pd.testing.assert_frame_equal(results[0][0], results[1][0])
+        pd.testing.assert_frame_equal(results[0][1], results[1][1])
@@ -1,11 +1,16 @@
 """Unit tests for runners/mimic_runner.py"""
 
+import numpy as np
+import pandas as pd
 import pytest
 from unittest.mock import patch
 
 from tests.globals import SEED
 
-from mlrose_ky import MIMICRunner, FlipFlopGenerator
+from mlrose_ky import MIMICRunner, FlipFlopGenerator, FourPeaksGenerator, ContinuousPeaksGenerator, ContinuousPeaks, DiscreteOpt
+
+# noinspection PyProtectedMember
+from mlrose_ky.runners._runner_base import _CachedFitness
 
 
 class TestMIMICRunner:
@@ -57,6 +62,86 @@ class TestMIMICRunner:
             assert dict(mock_mimic.call_args[1]["callback_user_info"])["pop_size"] in runner_kwargs["population_sizes"]
             assert dict(mock_mimic.call_args[1]["callback_user_info"])["keep_pct"] in runner_kwargs["keep_percent_list"]
 
+    def test_run_spawns_rng_per_grid_point(self, runner_kwargs):
+        """Test each grid point runs with its own random number generator when the problem has one."""
+        problem = DiscreteOpt(10, ContinuousPeaks(), rng=np.random.default_rng(SEED), dtype=np.int8)
+        runner_kwargs["problem"] = problem
+        rngs = []
+        initial_states = []
+
+        def record_problem(**kwargs):
+            rngs.append(kwargs["problem"].rng)
+            initial_states.append(kwargs["problem"].get_state())
+
+        module_path = MIMICRunner.__module__
+        with patch(f"{module_path}.mimic_binary", side_effect=record_problem):
+            MIMICRunner(**runner_kwargs).run()
+
+        assert len(rngs) == 4 and len({id(rng) for rng in rngs}) == 4
+
+        # Each grid point draws its initial state from its own child of the runner's seed sequence
+        for state, seed_sequence in zip(initial_states, np.random.SeedSequence(runner_kwargs["seed"]).spawn(4)):
+            assert np.array_equal(state, np.random.default_rng(seed_sequence).integers(0, 2, 10, dtype=np.int8))
+
+    @pytest.mark.parametrize("use_fast_mimic", [True, False])
+    def test_run_dispatches_bit_string_problems_to_mimic_binary(self, runner_kwargs, use_fast_mimic):
+        """Test bit-string problems run with mimic_binary in fast MIMIC mode and with mimic otherwise."""
+        runner_kwargs["problem"] = ContinuousPeaksGenerator.generate(SEED, 10)
+        runner_kwargs["use_fast_mimic"] = use_fast_mimic
+        module_path = MIMICRunner.__module__
+        with patch(f"{module_path}.mimic") as mock_mimic, patch(f"{module_path}.mimic_binary") as mock_mimic_binary:
+            MIMICRunner(**runner_kwargs).run()
+
+        assert mock_mimic_binary.called == use_fast_mimic
+        assert mock_mimic.called != use_fast_mimic
+
+    def test_use_fast_mimic_caches_fitness_during_run(self, runner_kwargs):
+        """Test fast MIMIC mode caches a bit-string fitness function without batch evaluation only while running."""
+        problem = FourPeaksGenerator.generate(SEED, 10)
+        fitness_fn = problem.fitness_fn
+        runner_kwargs["problem"] = problem
+        fitness_fns = []
+        module_path = MIMICRunner.__module__
+        with patch(f"{module_path}.mimic_binary", side_effect=lambda **kwargs: fitness_fns.append(kwargs["problem"].fitness_fn)):
+            MIMICRunner(**runner_kwargs).run()
+
+        assert fitness_fns and all(isinstance(fn, _CachedFitness) and fn.fitness_fn is fitness_fn for fn in fitness_fns)
+        assert problem.fitness_fn is fitness_fn
+
+    def test_use_fast_mimic_keeps_native_batch_fitness(self, runner_kwargs):
+        """Test fast MIMIC mode does not cache a fitness function that has a native evaluate_batch."""
+        problem = ContinuousPeaksGenerator.generate(SEED, 10)
+        fitness_fn = problem.fitness_fn
+        runner_kwargs["problem"] = problem
+        fitness_fns = []
+        module_path = MIMICRunner.__module__
+        with patch(f"{module_path}.mimic_binary", side_effect=lambda **kwargs: fitness_fns.append(kwargs["problem"].fitness_fn)):
+            MIMICRunner(**runner_kwargs).run()
+
+        assert fitness_fns and all(fn is fitness_fn for fn in fitness_fns)
+        assert problem.fitness_fn is fitness_fn
+
+    def test_use_fast_mimic_keeps_user_defined_fitness(self, runner_kwargs):
+        """Test fast MIMIC mode does not cache a user-defined fitness class, which may not be deterministic."""
+
+        class NoisyOneMax:
+            def evaluate(self, state):
+                return np.sum(state) + np.random.rand()
+
+            def get_prob_type(self):
+                return "discrete"
+
+        fitness_fn = NoisyOneMax()
+        problem = DiscreteOpt(10, fitness_fn)
+        runner_kwargs["problem"] = problem
+        fitness_fns = []
+        module_path = MIMICRunner.__module__
+        with patch(f"{module_path}.mimic", side_effect=lambda **kwargs: fitness_fns.append(kwargs["problem"].fitness_fn)):
+            MIMICRunner(**runner_kwargs).run()
+
+        assert fitness_fns and all(fn is fitness_fn for fn in fitness_fns)
+        assert problem.fitness_fn is fitness_fn
+
     def test_use_fast_mimic_flag(self, runner_kwargs):
         """Test the use_fast_mimic flag is set correctly."""
         problem = runner_kwargs["problem"]
@@ -104,3 +189,14 @@ class TestMIMICRunner:
         assert runner.iteration_list == runner_kwargs["iteration_list"]
         assert runner.population_sizes == runner_kwargs["population_sizes"]
         assert runner.keep_percent_list == runner_kwargs["keep_percent_list"]
+
+    def test_parallel_run_matches_sequential_run(self, runner_kwargs):
+        """Test running grid points in parallel gives the same results as running them sequentially."""
+        results = []
+        for n_jobs in [1, 2]:
+            runner_kwargs["problem"] = DiscreteOpt(12, ContinuousPeaks(), rng=np.random.default_rng(SEED), dtype=np.int8)
+            run_stats, curves = MIMICRunner(**runner_kwargs, n_jobs=n_jobs).run()
+            results.append((run_stats.drop(columns="Time"), curves.drop(columns="Time")))
+
+        pd.testing.assert_frame_equal(results[0][0], results[1][0])
+        pd.testing.assert_frame_equal(results[0][1], results[1][1])
@@ -1,7 +1,8 @@
 """Unit tests for runners/nngs_runner.py"""
 
 import copy
-from unittest.mock import patch
+import sys
+from unittest.mock import patch, Mock
 
 import pytest
 import sklearn.metrics as skmt
@@ -94,6 +95,14 @@ class TestNNGSRunner:
         """Test initialization with default grid search parameters."""
         assert runner.grid_search_parameters["learning_rate"] == [0.001, 0.002]
 
+    def test_output_format_forwarded_to_runner_base(self, runner_kwargs):
+        """Test output_format is applied to the runner rather than added to the grid search parameters."""
+        with patch.dict(sys.modules, {"pyarrow": Mock()}):
+            runner = NNGSRunner(**runner_kwargs, output_format="parquet")
+
+        assert runner.output_format == "parquet"
+        assert "output_format" not in runner.grid_search_parameters
+
     def test_max_iters_replacement_in_grid_search_parameters(self, runner_kwargs):
         """Test that 'max_iter' is replaced with 'max_iters' in grid_search_parameters."""
         runner_kwargs["grid_search_parameters"].update({"max_iter": [1, 2, 3, 4, 5, 6]})
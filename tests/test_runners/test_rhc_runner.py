@@ -1,11 +1,13 @@
 """Unit tests for runners/rhc_runner.py"""
 
+import numpy as np
+import pandas as pd
 import pytest
 from unittest.mock import patch
 
 from tests.globals import SEED
 
-from mlrose_ky import RHCRunner, FlipFlopGenerator
+from mlrose_ky import RHCRunner, FlipFlopGenerator, ContinuousPeaks, DiscreteOpt
 
 
 class TestRHCRunner:
@@ -75,3 +77,23 @@ class TestRHCRunner:
         assert runner.seed == runner_kwargs["seed"]
         assert runner.iteration_list == runner_kwargs["iteration_list"]
         assert runner.restart_list == runner_kwargs["restart_list"]
+
+    def test_parallel_run_matches_sequential_run(self, runner_kwargs):
+        """Test running grid points in parallel gives the same results as running them sequentially, with a problem rng."""
+        runner_kwargs.update({"restart_list": [2, 4], "max_attempts": 10})
+        results = []
+        for n_jobs in [1, 2]:
+            runner_kwargs["problem"] = DiscreteOpt(20, ContinuousPeaks(), rng=np.random.default_rng(SEED), dtype=np.int8)
+            run_stats, curves = RHCRunner(**runner_kwargs, n_jobs=n_jobs).run()
+            results.append((run_stats.drop(columns="Time"), curves.drop(columns="Time")))
+
+        pd.testing.assert_frame_equal(results[0][0], results[1][0])
+        pd.testing.assert_frame_equal(results[0][1], results[1][1])
+
+    def test_run_restores_problem_rng(self, runner_kwargs):
+        """Test the problem keeps its own random number generator after the per-grid-point generators are used."""
+        rng = np.random.default_rng(SEED)
+        runner_kwargs.update({"problem": DiscreteOpt(20, ContinuousPeaks(), rng=rng, dtype=np.int8), "restart_list": [2, 4]})
+        RHCRunner(**runner_kwargs).run()
+
+        assert runner_kwargs["problem"].rng is rng
@@ -6,17 +6,19 @@ import copy
 # License: BSD 3-clause
 
 import pickle as pk
+import re
 import signal
+import sys
 from unittest.mock import patch, Mock, mock_open
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from mlrose_ky import FlipFlopOpt
+from mlrose_ky import ContinuousPeaks, FlipFlopOpt
 
 # noinspection PyProtectedMember
-from mlrose_ky.runners._runner_base import _RunnerBase
+from mlrose_ky.runners._runner_base import _RunnerBase, _CachedFitness
 from tests.globals import SEED
 
 
@@ -298,6 +300,19 @@ class TestRunnerBase:
                 # Check that the result is True
                 assert result is True
 
+    def test_save_state_logs_remaining_checkpoints_when_done(self, _test_runner_fixture):
+        """Test that _save_state logs a row for every remaining checkpoint iteration when the run finishes early."""
+        runner = _test_runner_fixture(iteration_list=2 ** np.arange(6), generate_curves=False, output_directory=None)
+        runner._setup()
+        runner._start_run_timing()
+
+        with patch("logging.debug"):
+            assert runner._save_state(iteration=4, state="state4", fitness=0.5, user_data={}) is True
+            assert runner._save_state(iteration=5, state="state5", fitness=0.6, user_data={}) is True
+            assert runner._save_state(iteration=6, state="state6", fitness=0.9, user_data={}, done=True) is False
+
+        assert [stat["Iteration"] for stat in runner._raw_run_stats] == [4, 8, 16, 32]
+
     def test_save_state_sets_curve_when_generate_curves_true_and_iteration_zero_and_curve_none(self, _test_runner_fixture):
         """Test that _save_state sets curve and _first_curve_synthesized when generate_curves is True, iteration is 0, and curve is None."""
         runner = _test_runner_fixture(iteration_list=[0, 1, 2], generate_curves=True)
@@ -321,6 +336,20 @@ class TestRunnerBase:
                 # Check that _first_curve_synthesized is set to True
                 assert runner._first_curve_synthesized is True
 
+    def test_save_state_only_checkpoints_data_frames_with_output_directory(self, _test_runner_fixture):
+        """Test that _save_state only rebuilds and saves the data frames when there is an output directory."""
+        for output_directory, expected_calls in [(None, 0), ("test_output", 1)]:
+            runner = _test_runner_fixture(iteration_list=[0, 1, 2], generate_curves=True, output_directory=output_directory)
+            with patch("os.makedirs"), patch("os.path.exists", return_value=True):
+                runner._setup()
+            runner._start_run_timing()
+
+            with patch("logging.debug"), patch.object(runner, "_create_and_save_run_data_frames") as mock_create_and_save:
+                runner._save_state(iteration=1, state="state1", fitness=0.95, user_data={}, curve=[(0.9, 1), (0.95, 2)])
+
+            assert mock_create_and_save.call_count == expected_calls
+            assert len(runner._raw_run_stats) == 1 and len(runner._fitness_curves) == 2
+
     def test_create_curve_stat_with_dict_curve_value(self, _test_runner_fixture):
         """Test that _create_curve_stat correctly updates with dict curve_value."""
         runner = _test_runner_fixture()
@@ -461,6 +490,54 @@ class TestRunnerBase:
                     algorithm=mock_algorithm, problem=runner.problem, max_attempts=100, curve=True, callback_user_info={}
                 )
 
+    def test_run_experiments_in_parallel_checkpoints_each_grid_point(self, _test_runner_fixture):
+        """Test each grid point returned by a worker is merged and checkpointed before the next one arrives."""
+        runner = _test_runner_fixture()
+        runner._raw_run_stats, runner._fitness_curves = [], []
+        checkpointed = []
+        runner._create_and_save_run_data_frames = Mock(side_effect=lambda: checkpointed.append(len(runner._raw_run_stats)))
+
+        def fake_parallel(**_kwargs):
+            return lambda tasks: (([args[3]], [{"Curve": args[3]}]) for _, args, _ in tasks)
+
+        with patch("mlrose_ky.runners._runner_base.Parallel", side_effect=fake_parallel):
+            runner._run_experiments_in_parallel(Mock(), [{"a": 1}, {"a": 2}, {"a": 3}])
+
+        assert runner._raw_run_stats == [0, 1, 2]
+        assert checkpointed == [1, 2, 3]
+        assert runner._curve_base == 3
+
+    def test_run_experiments_in_parallel_keeps_finished_grid_points_on_abort(self, _test_runner_fixture):
+        """Test a Ctrl-C during a parallel run keeps the grid points that finished and ignores the interrupted workers."""
+        runner = _test_runner_fixture(output_directory=None)
+        runner._raw_run_stats, runner._fitness_curves = [], []
+
+        def results(tasks):
+            tasks = list(tasks)
+            yield [{"Grid": 0}], []
+            runner._ctrl_c_handler(signal.SIGINT, None)
+            raise KeyboardInterrupt
+
+        with patch("mlrose_ky.runners._runner_base.Parallel", return_value=results):
+            runner._run_experiments_in_parallel(Mock(), [{"a": 1}, {"a": 2}, {"a": 3}])
+
+        assert runner.has_aborted()
+        assert runner._raw_run_stats == [{"Grid": 0}]
+
+    def test_run_experiments_in_parallel_raises_worker_errors(self, _test_runner_fixture):
+        """Test a worker failure that is not caused by an abort is raised."""
+        runner = _test_runner_fixture(output_directory=None)
+        runner._raw_run_stats, runner._fitness_curves = [], []
+
+        def results(tasks):
+            tasks = list(tasks)
+            yield [{"Grid": 0}], []
+            raise RuntimeError("worker failed")
+
+        with patch("mlrose_ky.runners._runner_base.Parallel", return_value=results):
+            with pytest.raises(RuntimeError, match="worker failed"):
+                runner._run_experiments_in_parallel(Mock(), [{"a": 1}, {"a": 2}])
+
     def test_dump_df_to_disk_saves_csv_and_logs_when_final_save_true(self, _test_runner_fixture):
         """Test that _dump_df_to_disk saves CSV file and logs when final_save is True."""
         runner = _test_runner_fixture()
@@ -484,6 +561,51 @@ class TestRunnerBase:
             # Check that logging.info was called
             mock_logging.assert_called_once_with("Saved: [test_output/test_df.csv]")
 
+    def test_dump_df_to_disk_saves_parquet_when_output_format_is_parquet(self, _test_runner_fixture):
+        """Test that _dump_df_to_disk saves a zstd-compressed Parquet file instead of a CSV file."""
+        with patch.dict(sys.modules, {"pyarrow": Mock()}):
+            runner = _test_runner_fixture(output_format="parquet")
+        df = pd.DataFrame({"A": [1], "State": [np.array([0, 1])]})
+
+        with (
+            patch.object(runner, "_dump_pickle_to_disk", return_value="test_output/test_df"),
+            patch.object(pd.DataFrame, "to_parquet", autospec=True) as mock_to_parquet,
+            patch.object(df, "to_csv") as mock_to_csv,
+            patch("logging.info") as mock_logging,
+        ):
+            runner._dump_df_to_disk(df, df_name="test_df", final_save=True)
+
+            written_df, filename = mock_to_parquet.call_args.args
+            assert filename == "test_output/test_df.parquet"
+            assert mock_to_parquet.call_args.kwargs == {"compression": "zstd"}
+            assert written_df["State"].iloc[0] == str(np.array([0, 1]))
+            mock_to_csv.assert_not_called()
+            mock_logging.assert_called_once_with("Saved: [test_output/test_df.parquet]")
+
+    def test_dump_df_to_disk_parquet_round_trip(self, _test_runner_fixture, tmp_path):
+        """Test that a DataFrame saved as Parquet reads back with its values, and object columns as strings."""
+        pytest.importorskip("pyarrow", exc_type=ImportError)
+        runner = _test_runner_fixture(output_format="parquet", output_directory=str(tmp_path))
+        df = pd.DataFrame({"Iteration": [0, 1], "Fitness": [1.5, 2.5], "State": [np.array([0, 1]), np.array([1, 1])]})
+
+        runner._dump_df_to_disk(df, df_name="run_stats_df")
+
+        (filename,) = tmp_path.rglob("*.parquet")
+        loaded_df = pd.read_parquet(filename)
+        pd.testing.assert_frame_equal(loaded_df[["Iteration", "Fitness"]], df[["Iteration", "Fitness"]])
+        assert loaded_df["State"].tolist() == [str(state) for state in df["State"]]
+
+    def test_parquet_output_format_requires_pyarrow(self, _test_runner_fixture):
+        """Test that choosing Parquet output without an importable pyarrow fails when the runner is created."""
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with pytest.raises(ImportError, match=re.escape("output_format='parquet' requires pyarrow")):
+                _test_runner_fixture(output_format="parquet")
+
+    def test_invalid_output_format(self, _test_runner_fixture):
+        """Test that an unknown output format is rejected."""
+        with pytest.raises(ValueError, match="output_format must be 'csv' or 'parquet', got 'xlsx'."):
+            _test_runner_fixture(output_format="xlsx")
+
     def test_save_state_copies_first_fitness_to_zeroth_iteration(self, _test_runner_fixture):
         """Test that _save_state copies first fitness to zeroth iteration when conditions are met."""
         runner = _test_runner_fixture(iteration_list=[0, 1, 2], generate_curves=True, copy_zero_curve_fitness_from_first=True)
@@ -616,3 +738,43 @@ class TestRunnerBase:
             # Verify that _current_logged_algorithm_args includes both total_args and additional_algorithm_args
             expected_logged_args = {"extra_arg1": "value1", "additional_arg1": "value2"}
             assert runner._current_logged_algorithm_args == expected_logged_args
+
+
+class TestCachedFitness:
+    def test_evaluate_reuses_cached_value(self):
+        """Test that repeated states are only evaluated once by the wrapped fitness function."""
+        fitness_fn = Mock(wraps=ContinuousPeaks(t_pct=0.15))
+        cached = _CachedFitness(fitness_fn)
+        state = np.array([0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1])
+
+        assert cached.evaluate(state) == 17
+        assert cached.evaluate(state.copy()) == 17
+        assert fitness_fn.evaluate.call_count == 1
+
+    def test_evaluate_batch_evaluates_only_misses(self):
+        """Test that evaluate_batch only passes uncached states to the wrapped fitness function."""
+        fitness_fn = ContinuousPeaks(t_pct=0.15)
+        cached = _CachedFitness(fitness_fn)
+        states = np.random.default_rng(SEED).integers(0, 2, (20, 12))
+        cached.evaluate(states[0])
+
+        with patch.object(fitness_fn, "evaluate_batch", wraps=fitness_fn.evaluate_batch) as mock_evaluate_batch:
+            result = cached.evaluate_batch(states)
+
+        assert np.array_equal(result, fitness_fn.evaluate_batch(states))
+        assert len(mock_evaluate_batch.call_args[0][0]) == len({row.tobytes() for row in states[1:]} - {states[0].tobytes()})
+
+    def test_max_size_evicts_least_recently_used(self):
+        """Test that the cache never grows beyond max_size."""
+        cached = _CachedFitness(ContinuousPeaks(), max_size=2)
+        for state in ([0, 0, 1], [0, 1, 1], [1, 1, 1]):
+            cached.evaluate(np.array(state))
+
+        assert len(cached) == 2
+
+    def test_forwards_attributes_and_pickles(self):
+        """Test that attribute lookups are forwarded and that the wrapper can be pickled."""
+        cached = pk.loads(pk.dumps(_CachedFitness(ContinuousPeaks(t_pct=0.3))))
+
+        assert cached.t_pct == 0.3
+        assert cached.get_prob_type() == "discrete"
@@ -1,10 +1,11 @@
 """Unit tests for runners/skmlp_runner.py"""
 
 import re
+import sys
 import threading
 import time
 import warnings
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 import pytest
 import sklearn.metrics as skmt
@@ -101,6 +102,14 @@ class TestSKMLPRunner:
 
         assert runner.has_aborted()
 
+    def test_output_format_forwarded_to_runner_base(self, runner_kwargs):
+        """Test output_format is applied to the runner rather than passed to the classifier."""
+        with patch.dict(sys.modules, {"pyarrow": Mock()}):
+            runner = SKMLPRunner(**runner_kwargs, output_format="parquet")
+
+        assert runner.output_format == "parquet"
+        assert "output_format" not in runner.grid_search_parameters
+
     def test_max_attempts_in_grid_search_parameters(self, runner_kwargs):
         """Test that max_attempts is correctly converted to n_iter_no_change."""
         runner = SKMLPRunner(**runner_kwargs)